@@ -1,8 +1,6 @@
 import json
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydash import py_
-
 from dialogy.types import BaseEntity
 from dialogy.utils import normalize
 
@@ -36,18 +34,15 @@ class EntityScoringMixin:
         :return: A list of entities with score higher than configured threshold.
         :rtype: List[BaseEntity]
         """
-        if self.threshold is None:
+        threshold = self.threshold
+        if threshold is None:
             return entities
 
-        high_scoring_entities = []
-        for entity in entities:
-            if entity.score is None:
-                high_scoring_entities.append(entity)
-
-            if entity.score is not None and self.threshold < entity.score:
-                high_scoring_entities.append(entity)
-
-        return high_scoring_entities
+        return [
+            entity
+            for entity in entities
+            if entity.score is None or threshold < entity.score
+        ]
 
     def aggregate_entities(
         self,
@@ -78,11 +73,11 @@ class EntityScoringMixin:
                 for entity in entities
                 if isinstance(entity.alternative_index, int)
             ]
-            min_alternative_index = py_.min_(indices) if indices else None
+            min_alternative_index = min(indices) if indices else None
             representative = entities[0]
             representative.alternative_index = min_alternative_index
             representative.alternative_indices = indices
-            representative.score = entity_scoring(len(py_.uniq(indices)), input_size)
+            representative.score = entity_scoring(len(set(indices)), input_size)
             aggregated_entities.append(representative)
         return aggregated_entities
 
@@ -113,9 +108,11 @@ class EntityScoringMixin:
         :return: A list of entities scored and unique by type and value.
         :rtype: List[BaseEntity]
         """
-        entity_type_value_group = py_.group_by(
-            entities, lambda entity: (entity.type, entity.get_value())
-        )
+        entity_type_value_group: Dict[Tuple[str, Any], List[BaseEntity]] = {}
+        for entity in entities:
+            entity_type_value_group.setdefault(
+                (entity.type, entity.get_value()), []
+            ).append(entity)
         aggregate_entities = self.aggregate_entities(
             entity_type_value_group, input_size
         )
@@ -502,20 +502,31 @@ to capture *"2022-03-17T12:00:00+05:30"* so for that we can define a time range
 Now we can see that it gives the correct entity value i.e *"2022-03-17T12:00:00+05:30"*
 
 """
+import itertools
 import operator
 import traceback
+from collections import OrderedDict
 from datetime import datetime
 from pprint import pformat
 from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlencode
 import aiohttp
 import asyncio
 import json
-from aiohttp.client_exceptions import ClientConnectorError
+from aiohttp.client_exceptions import (
+    ClientConnectorError,
+    ClientOSError,
+    ServerDisconnectedError,
+)
+
+try:
+    from aiohttp import ConnectionTimeoutError
+except ImportError:  # pragma: no cover
+    # aiohttp<3.10 doesn't tell connect timeouts apart from read timeouts, both are only retried from 3.10.
+    ConnectionTimeoutError = ClientConnectorError  # type: ignore
 
 import pandas as pd
-import pydash as py_
 import pytz
-import requests
 from pytz.tzinfo import BaseTzInfo
 from tqdm import tqdm
 
@@ -526,6 +537,12 @@ from dialogy.types import BaseEntity, Intent
 from dialogy.types.entity.deserialize import EntityDeserializer
 from dialogy.utils import dt2timestamp, lang_detect_from_text, logger
 
+try:
+    # orjson decodes Duckling's responses considerably faster, it is used when installed.
+    from orjson import loads as json_loads
+except ModuleNotFoundError:  # pragma: no cover
+    from json import loads as json_loads
+
 
 class DucklingPlugin(EntityScoringMixin, Plugin):
     """
@@ -562,6 +579,21 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
 
     :param url: The address where Duckling's entity parser can be reached, defaults to "http://0.0.0.0:8000/parse".
     :type url: Optional[str]
+
+    :param connect_timeout: Seconds to wait for a connection to Duckling, defaults to 0.1. The
+    :code:`timeout` is used as the read timeout, so a slow connect can't consume the whole budget.
+    :type connect_timeout: float
+
+    :param max_retries: Retries for connection errors, connect timeouts and 502, 503, 504 responses, defaults to 2.
+    Requests that time out while reading are not retried, they produce no entities instead.
+    :type max_retries: int
+
+    :param backoff_factor: Seconds to wait before the first retry, doubled for each retry after, defaults to 0.05.
+    :type backoff_factor: float
+
+    :param cache_size: Number of Duckling responses to keep for repeated requests, defaults to 0 (no caching).
+    A response is reused only for the same text, locale, reference time and latent setting.
+    :type cache_size: int
     """
 
     FUTURE = const.FUTURE
@@ -576,6 +608,22 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
 
     __DATETIME_OPERATION_ALIAS = {FUTURE: operator.ge, PAST: operator.le}
 
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    """
+    Duckling responses with these status codes are retried.
+    """
+
+    RETRY_EXCEPTIONS = (
+        ClientConnectorError,
+        ClientOSError,
+        ServerDisconnectedError,
+        ConnectionTimeoutError,
+    )
+    """
+    Requests failing with these errors are retried, they cover an unreachable server
+    and keep-alive connections that the server dropped.
+    """
+
     def __init__(
         self,
         dimensions: List[str],
@@ -595,6 +643,10 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         output_column: Optional[str] = None,
         use_transform: bool = False,
         debug: bool = False,
+        connect_timeout: float = 0.1,
+        max_retries: int = 2,
+        backoff_factor: float = 0.05,
+        cache_size: int = 0,
         **kwargs: Any
     ) -> None:
         """
@@ -610,24 +662,36 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
             **kwargs
         )
         self.dimensions = dimensions
+        # Dimensions don't change between requests, so they are serialized once.
+        self._dims = json.dumps(dimensions)
         self.locale = locale
         self.timezone = timezone
+        # Resolved once, an invalid timezone fails here instead of on every request.
+        self._tz = self.__set_timezone()
+        # The encoded form of request fields that are the same for every request.
+        self._static_body = urlencode({"tz": str(self._tz), "dims": self._dims})
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._client_timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=timeout
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.cache_size = cache_size
+        # Least recently used responses are evicted first, keyed by the encoded request body.
+        self._response_cache: OrderedDict[bytes, List[Dict[str, Any]]] = OrderedDict()
         self.threshold = threshold
         self.url = url
         self.temporal_intents = temporal_intents or {}
         self.reference_time: Optional[int] = None
         self.reference_time_column = reference_time_column
         self.datetime_filters = datetime_filters
+        # Comparison operators resolved from datetime filters, filled as filters are used.
+        self._datetime_operations: Dict[str, Callable[[Any, Any], bool]] = dict(
+            self.__DATETIME_OPERATION_ALIAS
+        )
         self.activate_latent_entities = activate_latent_entities
         self.constraints = constraints
-        self.session = requests.Session()
-        self.session.mount(
-            "http://",
-            requests.adapters.HTTPAdapter(
-                max_retries=1, pool_maxsize=10, pool_block=True
-            ),
-        )
         self.headers: Dict[str, str] = {
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8"
         }
@@ -660,7 +724,7 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         reference_time: Optional[int] = None,
         locale: str = "en_IN",
         use_latent: Union[Callable[..., bool], bool] = False,
-    ) -> Dict[str, Any]:
+    ) -> bytes:
         """
         create request body for entity parsing
 
@@ -675,10 +739,9 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         relevant for time related entities. Resolve relative time like "yesterday", "next month", etc.
         :type Optional[int]
         :param reference_time: Optional[int]
-        :return: request object for Duckling API.
-        :rtype: Dict[str, Any]
+        :return: url-encoded request body for Duckling API.
+        :rtype: bytes
         """
-        dimensions = self.dimensions
         activate_latent_entities = use_latent
 
         activate_latent_entities = (
@@ -690,26 +753,52 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         payload = {
             "text": text,
             "locale": locale or self.locale,
-            "tz": str(self.__set_timezone()),
-            "dims": json.dumps(dimensions),
             "reftime": reference_time,
             "latent": activate_latent_entities,
         }
         logger.debug("Duckling API payload:")
-        logger.debug(pformat(payload))
+        logger.opt(lazy=True).debug(
+            "{}", lambda: pformat({**payload, "tz": str(self._tz), "dims": self._dims})
+        )
 
-        return payload
+        # Encoded once here, so retries send the same bytes.
+        return f"{urlencode(payload)}&{self._static_body}".encode("utf-8")
 
     def get_operator(self, filter_type: Any) -> Any:
         try:
             return getattr(operator, filter_type)
         except (AttributeError, TypeError) as exception:
-            logger.debug(traceback.format_exc())
+            logger.opt(lazy=True).debug("{}", traceback.format_exc)
             raise ValueError(
                 f"Expected datetime_filters to be one of {self.FUTURE}, {self.PAST} "
                 "or a valid comparison operator here: https://docs.python.org/3/library/operator.html"
             ) from exception
 
+    def get_datetime_operation(self, filter_type: Any) -> Callable[[Any, Any], bool]:
+        """
+        Resolve the comparison operator for a datetime filter, resolved operators are cached.
+
+        :param filter_type: One of :code:`DucklingPlugin.FUTURE`, :code:`DucklingPlugin.PAST` or a name from the
+            `operator <https://docs.python.org/3/library/operator.html>`_ module.
+        :type filter_type: str
+        :raises TypeError: If filter_type is not a str.
+        :raises ValueError: If filter_type is not a known operator.
+        :return: A comparison operator.
+        :rtype: Callable[[Any, Any], bool]
+        """
+        if not isinstance(filter_type, str):
+            raise TypeError(
+                f"Expected datetime_filters to be a str and one of {self.FUTURE}, {self.PAST} or"
+                " a valid comparison operator here: https://docs.python.org/3/library/operator.html"
+            )
+
+        operation = self._datetime_operations.get(filter_type)
+        if operation is None:
+            operation = self._datetime_operations[filter_type] = self.get_operator(
+                filter_type
+            )
+        return operation
+
     def select_datetime(
         self, entities: List[BaseEntity], filter_type: Any
     ) -> List[BaseEntity]:
@@ -723,28 +812,24 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         :return: List of entities obtained after applying comparator functions.
         :rtype: List[BaseEntity]
         """
-        if not isinstance(filter_type, str):
-            raise TypeError(
-                f"Expected datetime_filters to be a str and one of {self.FUTURE}, {self.PAST} or"
-                " a valid comparison operator here: https://docs.python.org/3/library/operator.html"
-            )
-
-        if filter_type in self.__DATETIME_OPERATION_ALIAS:
-            operation = self.__DATETIME_OPERATION_ALIAS[filter_type]
-        else:
-            operation = self.get_operator(filter_type)
+        operation = self.get_datetime_operation(filter_type)
 
-        if not self.reference_time:
+        reference_time = self.reference_time
+        if not reference_time:
             return entities  # pragma: no cover
 
-        time_entities, other_entities = py_.partition(
-            entities, lambda entity: entity.dim == const.TIME
-        )
+        time_entities = []
+        other_entities = []
+        for entity in entities:
+            if entity.dim == const.TIME:
+                time_entities.append(entity)
+            else:
+                other_entities.append(entity)
 
         filtered_time_entities = [
             entity
             for entity in time_entities
-            if operation(dt2timestamp(entity.get_value()), self.reference_time)
+            if operation(dt2timestamp(entity.get_value()), reference_time)
         ]
         return filtered_time_entities + other_entities
 
@@ -764,6 +849,10 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         :return: A list of entities obtained after applying filters.
         :rtype: List[BaseEntity]
         """
+        if not self.datetime_filters and self.threshold is None:
+            # Nothing is configured to filter, the default setup.
+            return entities
+
         if self.datetime_filters:
             return self.select_datetime(entities, self.datetime_filters)
 
@@ -809,8 +898,7 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         locale: str = "en_IN",
         reference_time: Optional[int] = None,
         use_latent: Union[Callable[..., bool], bool] = False,
-        sort_idx: int = 0,
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """
         Get entities from duckling-server.
 
@@ -824,29 +912,69 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
                                 to parse the values into usable dates/times, defaults to None
         :type reference_time: Optional[int], optional
         :raises ValueError: Duckling API call failure leading to no json response.
-        :return: Duckling entities as :code:`dicts`.
+        :return: Duckling entities as :code:`dicts`. Empty if Duckling didn't respond within the timeout.
         :rtype: List[Dict[str, Any]]
         """
+        if not text or text.isspace():
+            # Partial ASR n-bests can be blank, Duckling has nothing to find in them.
+            return []
+
         body = self.__create_req_body(
             text, reference_time=reference_time, locale=locale, use_latent=use_latent
         )
-        try:
-            async with session.post(self.url, data=body, headers=self.headers) as resp:
-                status = resp.status
-                if status == 200:
-                    result = await resp.json()
-                    # The API call was successful, expect the following to contain entities.
-                    # A list of dicts or an empty list.
-                    return {const.IDX: sort_idx, const.VALUE: result}
-                else:
-                    raise ValueError(
-                        f"Duckling API call failed | [{status}]: {await resp.text()}"
-                    )
+        if body in self._response_cache:
+            self._response_cache.move_to_end(body)
+            return self._response_cache[body]
+
+        attempt = 0
+        while True:
+            try:
+                async with session.post(
+                    self.url, data=body, headers=self.headers, timeout=self._client_timeout
+                ) as resp:
+                    status = resp.status
+                    if status == 200:
+                        result = json_loads(await resp.read())
+                        # The API call was successful, expect the following to contain entities.
+                        # A list of dicts or an empty list.
+                        self._cache_response(body, result)
+                        return result
+                    elif status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                        raise ValueError(
+                            f"Duckling API call failed | [{status}]: {await resp.text()}"
+                        )
+
+            except self.RETRY_EXCEPTIONS as connection_error:
+                # Connect timeouts are also asyncio.TimeoutError, they are handled here so they are retried.
+                if attempt >= self.max_retries:
+                    logger.error(f"Duckling server is turned off?: {connection_error}")
+                    logger.error(pformat(body))
+                    raise connection_error
+
+            except asyncio.TimeoutError:
+                # A stalled parse shouldn't fail the whole request, we only lose entities for this text.
+                logger.warning(f"Duckling API call timed out for {text=}.")
+                return []
+
+            attempt += 1
+            await asyncio.sleep(self.backoff_factor * 2 ** (attempt - 1))
+
+    def _cache_response(
+        self, body: bytes, entities: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Keep a successful Duckling response for requests with the same body.
 
-        except ClientConnectorError as connection_error:
-            logger.error(f"Duckling server is turned off?: {connection_error}")
-            logger.error(pformat(body))
-            raise connection_error
+        :param body: The url-encoded request body.
+        :type body: bytes
+        :param entities: Duckling entities as :code:`dicts`.
+        :type entities: List[Dict[str, Any]]
+        """
+        if not self.cache_size:
+            return
+        self._response_cache[body] = entities
+        if len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
 
     async def _get_entities_concurrent(
         self,
@@ -871,24 +999,24 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         :return: Duckling entities as :code:`dicts`.
         :rtype: List[List[Dict[str, Any]]]
         """
+        # ASR alternatives often repeat, each distinct text is sent to Duckling once.
+        unique_texts = list(dict.fromkeys(texts))
+        # The session, and its connection pool, is shared by the requests of this call and closed with it.
         async with aiohttp.ClientSession() as session:
-            tasks = []
-            for i, text in enumerate(texts):
-                tasks.append(asyncio.ensure_future(
+            results = await asyncio.gather(
+                *(
                     self._get_entities(
                         session,
                         text,
                         locale,
                         reference_time=reference_time,
                         use_latent=use_latent,
-                        sort_idx=i)))
-            results = await asyncio.gather(*tasks)
-            return [
-                entities[const.VALUE]
-                for entities in sorted(
-                    results, key=lambda entities: entities[const.IDX]
+                    )
+                    for text in unique_texts
                 )
-            ]
+            )
+        entities_by_text = dict(zip(unique_texts, results))
+        return [entities_by_text[text] for text in texts]
 
     def apply_entity_classes(
         self,
@@ -907,7 +1035,7 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
                     duration_cast_operator=duration_cast_operator,
                 )
             )
-        return py_.flatten(shaped_entities)
+        return list(itertools.chain.from_iterable(shaped_entities))
 
     def validate(
         self, input_: Union[str, List[str]], reference_time: Optional[int]
@@ -925,6 +1053,10 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
 
         if not input_is_str and not inputs_are_list_of_strings:
             raise TypeError(f"Expected {input_} to be a List[str] or str.")
+
+        # Checked here as well as when filtering, parse may return early for blank transcripts.
+        if self.datetime_filters:
+            self.get_datetime_operation(self.datetime_filters)
         return self
 
     async def parse(
@@ -957,6 +1089,9 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
         if isinstance(transcripts, str):
             transcripts = [transcripts]  # pragma: no cover
 
+        if all(not text or text.isspace() for text in transcripts):
+            return []
+
         list_of_entities = await self._get_entities_concurrent(
             transcripts,
             locale=locale,
@@ -968,8 +1103,8 @@ class DucklingPlugin(EntityScoringMixin, Plugin):
             reference_time,
             duration_cast_operator=duration_cast_operator,
         )
-        entities = self.entity_consensus(entities, len(transcripts))
-        return self.apply_filters(entities)
+        # entity_consensus applies filters on the aggregated entities.
+        return self.entity_consensus(entities, len(transcripts))
 
     async def utility(self, input: Input, output: Output) -> List[BaseEntity]:
         """
@@ -2,7 +2,7 @@
     IntentEntityMutatorPlugin
 """
 
-from typing import Any, List, Optional, Dict, Union, Tuple
+from typing import Any, List, Optional, Dict, FrozenSet, Union, Tuple
 
 from dialogy.base import Input, Output, Plugin, Guard
 from dialogy.types import BaseEntity, Intent
@@ -26,7 +26,45 @@ class IntentEntityMutatorPlugin(Plugin):
         )
 
         self.validate_rules(rules)
-        self.rules = rules
+        self.rules = self.compile_rules(rules)
+
+    @staticmethod
+    def compile_rules(
+        rules: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Convert the :code:`in` / :code:`not_in` search lists of each rule into frozensets.
+
+        Membership checks are made for every rule on every turn, so we pay for the conversion
+        once here instead of scanning lists per call. The input rules are left untouched.
+
+        :param rules: Validated swap rules.
+        :type rules: Dict[str, List[Dict[str, Any]]]
+        :return: A copy of the rules with frozenset search lists.
+        :rtype: Dict[str, List[Dict[str, Any]]]
+        """
+
+        def freeze(search_lists: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                key: frozenset(value) if key in const.SUB_PRIMITIVES else value
+                for key, value in search_lists.items()
+            }
+
+        compiled_rules = []
+        for rule in rules[const.BASE_KEY]:
+            conditions = {}
+            for primitive, search_lists in rule[const.CONDITIONS].items():
+                if search_lists and primitive == const.ENTITY:
+                    search_lists = {
+                        entity_primitive: freeze(entity_search_lists)
+                        for entity_primitive, entity_search_lists in search_lists.items()
+                    }
+                elif search_lists and primitive != const.TRANSCRIPT:
+                    search_lists = freeze(search_lists)
+                conditions[primitive] = search_lists
+            compiled_rules.append({**rule, const.CONDITIONS: conditions})
+
+        return {**rules, const.BASE_KEY: compiled_rules}
 
     def validate_rules(self, rules: Dict[str, List[Dict[str, Any]]]) -> None:
 
@@ -122,9 +160,9 @@ class IntentEntityMutatorPlugin(Plugin):
 
     def check_present_absent_primitive_val(
         self,
-        primitive_val: Union[str, List[str]],
+        primitive_val: Union[str, List[str], FrozenSet[str]],
         check_presence: bool,
-        search_list: List[str],
+        search_list: FrozenSet[str],
         received_transcripts: bool = False,
     ) -> bool:
 
@@ -136,12 +174,12 @@ class IntentEntityMutatorPlugin(Plugin):
                     else primitive_val not in search_list
                 )
             elif isinstance(
-                primitive_val, list
+                primitive_val, (list, frozenset)
             ):  # Check for the presence and absence of entities
                 return (
-                    len(set(primitive_val) & set(search_list)) > 0
+                    not search_list.isdisjoint(primitive_val)
                     if check_presence
-                    else len(set(primitive_val) & set(search_list)) == 0
+                    else search_list.isdisjoint(primitive_val)
                 )
 
         else:  # Check for the presence and absence of certain words in transcripts
@@ -168,7 +206,7 @@ class IntentEntityMutatorPlugin(Plugin):
     def check_passed_conditions(
         self,
         check_presence: bool,
-        primitive_conditions: Dict[str, List[str]],
+        primitive_conditions: Dict[str, FrozenSet[str]],
         unpacked_entities: Dict[str, Any],
         map_primitive_to_vals: Dict[str, Any],
     ) -> bool:
@@ -208,9 +246,9 @@ class IntentEntityMutatorPlugin(Plugin):
     ) -> Tuple[Union[List[Intent], List[BaseEntity]], str]:
 
         unpacked_entities = {
-            const.TYPE: [x.type for x in entities],
-            const.DIM: [x.dim for x in entities],
-            const.ENTITY_TYPE: [x.entity_type for x in entities],
+            const.TYPE: frozenset(x.type for x in entities),
+            const.DIM: frozenset(x.dim for x in entities),
+            const.ENTITY_TYPE: frozenset(x.entity_type for x in entities),
             const.VALUE: [x.value for x in entities],
         }
 
@@ -84,7 +84,7 @@ We also allow using `spacy's NER <https://spacy.io/usage/spacy-101#annotations-n
 """
 import re
 from pprint import pformat
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -100,6 +100,7 @@ Label = str
 Span = Tuple[int, int]
 Value = str
 MatchType = List[Tuple[Text, Label, Value, Span]]
+INLINE_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
 
 
 class ListEntityPlugin(EntityScoringMixin, Plugin):
@@ -156,7 +157,7 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
         self.threshold = threshold
         self.keywords = None
         self.spacy_nlp = spacy_nlp
-        self.compiled_patterns: Dict[str, Dict[str, List[Any]]] = {}
+        self.compiled_patterns: Dict[str, Dict[str, List[Pattern[str]]]] = {}
         self.flags = flags
 
         if self.style == const.REGEX:
@@ -166,20 +167,22 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
         """
         Pre compile regex patterns to speed up runtime evaluation.
 
-        This method's search will still be slow depending on the list of patterns.
+        Where possible, the patterns of an entity value are joined into a single alternation, so a transcript
+        is scanned once per entity value instead of once per pattern.
 
         :param candidates: A map for entity types and their pattern list.
         :type candidates: Optional[Dict[str, List[str]]]
         :return: None
         :rtype: NoneType
         """
-        logger.debug(
-            pformat(
+        logger.opt(lazy=True).debug(
+            "{}",
+            lambda: pformat(
                 {
                     "style": self.style,
                     "candidates": candidates,
                 }
-            )
+            ),
         )
         if not isinstance(candidates, dict):
             raise TypeError(
@@ -207,16 +210,45 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
                         re.compile(pattern, flags=self.flags)
                         for pattern in entity_patterns
                     ]
-                    if not self.compiled_patterns:
-                        self.compiled_patterns = {entity_type: {entity_value: patterns}}
-                    elif entity_type in self.compiled_patterns:
-                        self.compiled_patterns[entity_type][entity_value] = patterns
-                    else:
-                        self.compiled_patterns[entity_type] = {entity_value: patterns}
+                    self.compiled_patterns.setdefault(entity_type, {})[
+                        entity_value
+                    ] = self._merge_patterns(patterns)
 
         logger.debug("compiled patterns")
         logger.debug(self.compiled_patterns)
 
+    def _merge_patterns(self, patterns: List[Pattern[str]]) -> List[Pattern[str]]:
+        """
+        Join compiled patterns into a single alternation.
+
+        Patterns with groups can't be joined, group names would clash and backreferences would point
+        at other groups. Patterns with inline global flags like :code:`(?i)` can't be joined either, the
+        flags would apply to every pattern (or fail to compile on python>=3.11). These are returned as they are.
+
+        :param patterns: Patterns of an entity value, each compiled on its own.
+        :type patterns: List[Pattern[str]]
+        :return: A list with the joined pattern, or the patterns as they were.
+        :rtype: List[Pattern[str]]
+        """
+        if len(patterns) < 2 or any(pattern.groups for pattern in patterns):
+            return patterns
+        # Inline global flags show up in a compiled pattern's flags, unless they repeat self.flags.
+        default_flags = re.compile("", flags=self.flags).flags
+        if any(
+            pattern.flags != default_flags or INLINE_GLOBAL_FLAGS.search(pattern.pattern)
+            for pattern in patterns
+        ):
+            return patterns
+        try:
+            return [
+                re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+                    flags=self.flags,
+                )
+            ]
+        except re.error:
+            return patterns
+
     def _search(self, transcripts: List[str]) -> List[MatchType]:
         """
         Search for tokens in a list of strings.
@@ -226,7 +258,7 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
         :return: Token matches with the transcript.
         :rtype: List[MatchType]
         """
-        logger.debug(f"style: {self.style}")
+        logger.debug("style: {}", self.style)
         logger.debug("transcripts")
         logger.debug(transcripts)
         search_fn = self.__style_search_map.get(self.style)
@@ -235,8 +267,14 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
                 f"Expected style to be one of {list(self.__style_search_map.keys())}"
                 f' but "{self.style}" was found.'
             )
-        token_list = [search_fn(transcript) for transcript in transcripts]
-        return token_list
+        # ASR alternatives often repeat, each distinct non-empty transcript is searched once.
+        unique_transcripts = list(dict.fromkeys(filter(None, transcripts)))
+        if self.style == const.SPACY:
+            token_list = self.ner_search_batch(unique_transcripts)
+        else:
+            token_list = [search_fn(transcript) for transcript in unique_transcripts]
+        tokens_by_transcript = dict(zip(unique_transcripts, token_list))
+        return [tokens_by_transcript.get(transcript, []) for transcript in transcripts]
 
     def get_entities(self, transcripts: List[str]) -> List[BaseEntity]:
         """
@@ -263,14 +301,12 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
                     const.SCORE: 0,
                     const.ALTERNATIVE_INDEX: i,
                     const.LATENT: False,
-                    "__group": f"{label}_{text}",
                     const.TYPE: label,
                     const.ENTITY_TYPE: label,
                     const.VALUE: value,
                     const.VALUES: [{const.VALUE: value}],
                 }
 
-                del entity_dict["__group"]
                 entity_ = KeywordEntity.from_dict(entity_dict)
                 entity_.add_parser(self)
                 entities.append(entity_)
@@ -278,8 +314,8 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
         logger.debug("Parsed entities")
         logger.debug(entities)
 
-        aggregated_entities = self.entity_consensus(entities, len(transcripts))
-        return self.apply_filters(aggregated_entities)
+        # entity_consensus applies filters on the aggregated entities.
+        return self.entity_consensus(entities, len(transcripts))
 
     async def utility(self, input: Input, _: Output) -> Any:
         transcripts = input.transcripts
@@ -299,35 +335,33 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
                 "Expected spacy_nlp to be a spacy"
                 f" instance but {self.spacy_nlp} was found."
             )
-        parsed_transcript = self.spacy_nlp(transcript)
+        return self._ner_matches(self.spacy_nlp(transcript))
 
-        if self.labels:
-            return [
-                (
-                    token.text,
-                    token.label_,
-                    token.text,
-                    (
-                        transcript.index(token.text),
-                        transcript.index(token.text) + len(token.text),
-                    ),
-                )
-                for token in parsed_transcript.ents
-                if token.label_ in self.labels
-            ]
-        else:
-            return [
-                (
-                    token.text,
-                    token.label_,
-                    token.text,
-                    (
-                        transcript.index(token.text),
-                        transcript.index(token.text) + len(token.text),
-                    ),
-                )
-                for token in parsed_transcript.ents
-            ]
+    def ner_search_batch(self, transcripts: List[str]) -> List[MatchType]:
+        """
+        Wrapper over spacy's ner search for a list of transcripts.
+
+        Transcripts are processed together via :code:`spacy_nlp.pipe`, which batches the model's work.
+
+        :param transcripts: A list of strings to search entities within.
+        :type transcripts: List[str]
+        :return: NER parsing via spacy, for each transcript.
+        :rtype: List[MatchType]
+        """
+        if not self.spacy_nlp:
+            raise ValueError(
+                "Expected spacy_nlp to be a spacy"
+                f" instance but {self.spacy_nlp} was found."
+            )
+        return [self._ner_matches(doc) for doc in self.spacy_nlp.pipe(transcripts)]
+
+    def _ner_matches(self, parsed_transcript: Any) -> MatchType:
+        # spacy's entity spans carry their character offsets.
+        return [
+            (ent.text, ent.label_, ent.text, (ent.start_char, ent.end_char))
+            for ent in parsed_transcript.ents
+            if not self.labels or ent.label_ in self.labels
+        ]
 
     def regex_search(self, transcript: str) -> MatchType:
         """
@@ -348,15 +382,17 @@ class ListEntityPlugin(EntityScoringMixin, Plugin):
         for entity_type, entity_value_dict in self.compiled_patterns.items():
             for entity_value, entity_patterns in entity_value_dict.items():
                 for pattern in entity_patterns:
-                    matches = pattern.search(transcript)
-                    if matches:
-                        entity_value = (
-                            matches.group()
-                            if entity_value == const.ENTITY_VALUE_TOKEN
-                            else entity_value
-                        )
+                    for match in pattern.finditer(transcript):
+                        text = match.group()
                         entity_tokens.append(
-                            (matches.group(), entity_type, entity_value, matches.span())
+                            (
+                                text,
+                                entity_type,
+                                text
+                                if entity_value == const.ENTITY_VALUE_TOKEN
+                                else entity_value,
+                                match.span(),
+                            )
                         )
         logger.debug(entity_tokens)
         return entity_tokens
@@ -130,7 +130,7 @@ class ListSearchPlugin(EntityScoringMixin, Plugin):
         :return: Token matches with the transcript.
         :rtype: List[MatchType]
         """
-        logger.debug(f"style: {self.style}")
+        logger.debug("style: {}", self.style)
         logger.debug("transcripts")
         logger.debug(transcripts)
         search_fn = self.get_fuzzy_dp_search
@@ -282,22 +282,20 @@ class ListSearchPlugin(EntityScoringMixin, Plugin):
                     const.SCORE: 0,
                     const.ALTERNATIVE_INDEX: i,
                     const.LATENT: False,
-                    "__group": f"{label}_{text}",
                     const.TYPE: label,
                     const.ENTITY_TYPE: label,
                     const.VALUE: value,
                     const.VALUES: [{const.VALUE: value}],
                 }
 
-                del entity_dict["__group"]
                 entity_ = KeywordEntity.from_dict(entity_dict)
                 entity_.add_parser(self)
                 entities.append(entity_)
 
         logger.debug("Parsed entities")
         logger.debug(entities)
-        aggregated_entities = self.entity_consensus(entities, len(transcripts))
-        return self.apply_filters(aggregated_entities)
+        # entity_consensus applies filters on the aggregated entities.
+        return self.entity_consensus(entities, len(transcripts))
 
     async def utility(self, input_: Input, _: Output) -> Any:
         return self.get_entities(
@@ -3,10 +3,11 @@
 
 Expects 2 mandatory arguments:
 1. intent_oos -> str
-2. threshold value -> float
+2. threshold value -> float (any real number is accepted and coerced to float)
 """
 
-from typing import Any, List, Optional, Union
+from numbers import Real
+from typing import Any, Callable, List, Optional, Union
 
 from dialogy.base.plugin import Input, Output, Plugin, Guard
 from dialogy.types import Intent
@@ -31,9 +32,11 @@ class OOSFilterPlugin(Plugin):
                 f"intent_oos type should be string, received {type(intent_oos)}"
             )
 
-        if threshold and not isinstance(threshold, float):
+        if threshold is not None and (
+            isinstance(threshold, bool) or not isinstance(threshold, Real)
+        ):
             raise TypeError(
-                f"Threshold type should be float, received {type(threshold)}"
+                f"Threshold type should be a real number, received {type(threshold)}"
             )
 
         if intent_threshold_map_path and not isinstance(intent_threshold_map_path, str):
@@ -48,8 +51,13 @@ class OOSFilterPlugin(Plugin):
                 Please give either one."
             )
 
-        self.threshold = threshold
+        self.threshold = float(threshold) if threshold is not None else None
         self.intent_oos = intent_oos
+        # Intent is a pydantic model, unless it validates assignments its __setattr__ only adds
+        # overhead to re-labelling an intent, so the raw setter is used.
+        self._setattr: Callable[[Any, str, Any], None] = (
+            setattr if Intent.__config__.validate_assignment else object.__setattr__
+        )
 
         self.intent_threshold_map = None
         if intent_threshold_map_path and self.purpose != "train":
@@ -81,7 +89,7 @@ class OOSFilterPlugin(Plugin):
                 and intent_score < self.intent_threshold_map[intent_name]
             )
         ):
-            intents[0].name = self.intent_oos
+            self._setattr(intents[0], "name", self.intent_oos)
 
         return intents
 
@@ -90,6 +90,8 @@ class QCPlugin(Plugin):
             filtered_hash_with_different_intents_tagged
         )
         training_data["use"] = training_data["conflicting_intents"].isna()
+        # The hash is only needed to group rows, conflicting_intents is kept for the discarded report.
+        training_data.drop(columns="frozen_set_hash", inplace=True)
 
         return training_data
 
@@ -106,9 +108,9 @@ class QCPlugin(Plugin):
         if self.drop_conflicting_labels:
             training_data = self.identify_conflicting_labels(training_data)
 
-        training_data_ = training_data[training_data.use].copy()
-        training_data_.drop("use", axis=1, inplace=True)
-        discarded_data = training_data[~training_data["use"]]
+        keep = training_data["use"].to_numpy()
+        training_data_ = training_data.loc[keep, training_data.columns.drop("use")]
+        discarded_data = training_data.loc[~keep]
         discarded_data_size = len(discarded_data)
         if discarded_data_size:
             logger.debug(
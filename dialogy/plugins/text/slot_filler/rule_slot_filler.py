@@ -9,12 +9,12 @@ role. This plugin orchestrates the execution of slot filling via methods availab
 #. Once entities are found, we check if the slots can fill them using the :ref:`fill<FillSlot>` method.
 #. If no slots were filled, we remove the placeholders using :ref:`cleanup<CleanupSlot>` method.
 """
-from typing import List, Union, Set, Any
+from typing import Any, Dict, List, Set, Tuple, Union
 
 from dialogy.base import Guard, Input, Output, Plugin
 from dialogy.types import BaseEntity
 from dialogy.types.intent import Intent
-from dialogy.types.slots import Rule
+from dialogy.types.slots import Rule, compile_rules
 
 
 class RuleBasedSlotFillerPlugin(Plugin):
@@ -72,6 +72,23 @@ class RuleBasedSlotFillerPlugin(Plugin):
         )
         self.rules: Rule = rules or {}
 
+        # Rules are validated and flattened once, instead of on every call to `intent.apply`.
+        self._compiled_rules = compile_rules(self.rules)
+
+        # A two level index: intent name -> entity type -> names of slots that entity type can fill.
+        # Entities of any other type are dropped before filling, and the rest are only checked
+        # against the slots they can fill.
+        self._slot_index: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for intent_name, slot_types in self._compiled_rules.items():
+            entity_slots: Dict[str, List[str]] = {}
+            for slot_name, entity_types in slot_types:
+                for entity_type in dict.fromkeys(entity_types):
+                    entity_slots.setdefault(entity_type, []).append(slot_name)
+            self._slot_index[intent_name] = {
+                entity_type: tuple(slot_names)
+                for entity_type, slot_names in entity_slots.items()
+            }
+
         # fill_multiple
         # A boolean value that commands the slot filler to add multiple values of the
         # same entity type within a slot.
@@ -88,12 +105,18 @@ class RuleBasedSlotFillerPlugin(Plugin):
         entities: List[BaseEntity],
         expected_slots: Union[Set[str], None] = None,
     ) -> List[Intent]:
-        if not intents:
+        if not intents or not self._compiled_rules or not entities:
             return intents
 
         intent, *rest = intents
 
-        intent.apply(self.rules)
+        slot_types = self._compiled_rules.get(intent.name)
+        if not slot_types:
+            return intents
+
+        intent.apply_compiled(slot_types)
+        entity_slots = self._slot_index[intent.name]
+        entities = [entity for entity in entities if entity.entity_type in entity_slots]
         if self.sort_by_score:
             entities = sorted(
                 entities, key=lambda parse: parse.score or 0, reverse=True
@@ -102,7 +125,10 @@ class RuleBasedSlotFillerPlugin(Plugin):
             entities = sorted(entities, key=lambda parse: parse.alternative_index or 0)
         for entity in entities:
             intent.fill_slot(
-                entity, fill_multiple=self.fill_multiple, expected_slots=expected_slots
+                entity,
+                fill_multiple=self.fill_multiple,
+                expected_slots=expected_slots,
+                slot_names=entity_slots[entity.entity_type],
             )
         intent.cleanup()
         return [intent, *rest]
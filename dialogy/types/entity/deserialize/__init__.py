@@ -5,6 +5,14 @@ from dialogy import constants as const
 from dialogy.types.entity.base_entity import BaseEntity
 from dialogy.types.entity.keyword import KeywordEntity
 
+# Set forms of the Duckling constants, these are checked for every entity in a response.
+DUCKLING_ENTITY_KEYS = frozenset(const.DUCKLING_ENTITY_KEYS)
+DUCKLING_DIMS = frozenset(const.DUCKLING_DIMS)
+# Keys of a time-interval value, compared without sorting and joining them per entity.
+DUCKLING_TIME_INTERVAL_VALUE_KEYS = frozenset(
+    frozenset(keys.split()) for keys in const.DUCKLING_TIME_INTERVAL_ENTITY_KEYS
+)
+
 
 class EntityDeserializer:
     entitiy_classes: Dict[str, BaseEntity] = {}
@@ -20,14 +28,14 @@ class EntityDeserializer:
 
     @classmethod
     def validate(cls, duckling_entity_dict: Dict[str, Any]) -> None:
-        keys = tuple(sorted(duckling_entity_dict.keys()))
-        if keys != const.DUCKLING_ENTITY_KEYS:
+        if duckling_entity_dict.keys() != DUCKLING_ENTITY_KEYS:
+            keys = tuple(sorted(duckling_entity_dict.keys()))
             raise ValueError(
                 f"Invalid Duckling entity keys: {keys} expected {const.DUCKLING_ENTITY_KEYS}."
             )
 
         dimension = cls.get_dimension(duckling_entity_dict)
-        if dimension not in const.DUCKLING_DIMS:
+        if dimension not in DUCKLING_DIMS:
             raise ValueError(
                 f"Invalid Duckling dimension: {dimension} expected {const.DUCKLING_DIMS}."
             )
@@ -45,10 +53,11 @@ class EntityDeserializer:
 
     @classmethod
     def get_entity_class_str(cls, duckling_entity_dict: Dict[str, Any]) -> str:
+        value = duckling_entity_dict[const.VALUE]
         return (
             const.TIME_INTERVAL
-            if cls.get_keys_in_value_as_str(duckling_entity_dict)
-            in const.DUCKLING_TIME_INTERVAL_ENTITY_KEYS
+            if isinstance(value, dict)
+            and frozenset(value) in DUCKLING_TIME_INTERVAL_VALUE_KEYS
             else cls.get_dimension(duckling_entity_dict)
         )
 
@@ -17,12 +17,12 @@ We can obtain intents from :ref:`XLMRMultiClass<XLMRMultiClass>` and :ref:`MLPMu
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from pydantic import BaseModel, Field
 
 from dialogy.types import BaseEntity
-from dialogy.types.slots import Rule, Slot
+from dialogy.types.slots import Rule, Slot, SlotTypes, compile_rule
 from dialogy.utils.logger import logger
 
 
@@ -124,24 +124,23 @@ class Intent(BaseModel):
         if not rule:
             return self
 
-        for slot_name, entity_types in rule.items():
-            if isinstance(entity_types, str):
-                entity_type = entity_types
-                self.slots[slot_name] = Slot(
-                    name=slot_name, types=[entity_type], values=[]
-                )
-            elif isinstance(entity_types, list) and all(
-                isinstance(type_, str) for type_ in entity_types
-            ):
-                self.slots[slot_name] = Slot(
-                    name=slot_name, types=entity_types, values=[]
-                )
-            else:
-                raise TypeError(
-                    f"Expected entity_types={entity_types} in the rule"
-                    f" {rule} to be a List[str] but {type(entity_types)} was found."
-                )
+        return self.apply_compiled(compile_rule(rule))
 
+    def apply_compiled(self, slot_types: SlotTypes) -> Intent:
+        """
+        Create slots from a rule that was already validated by :code:`dialogy.types.slots.compile_rules`.
+
+        Skips re-validating the rule, for callers that apply the same rules on every request.
+
+        :param slot_types: Slot names paired with the entity types they can hold.
+        :type slot_types: SlotTypes
+        :return: The calling Intent is modified to have :ref:`Slots <slot>`.
+        :rtype: Intent
+        """
+        for slot_name, entity_types in slot_types:
+            self.slots[slot_name] = Slot(
+                name=slot_name, types=list(entity_types), values=[]
+            )
         return self
 
     def add_parser(self, plugin: Any) -> Intent:
@@ -165,6 +164,7 @@ class Intent(BaseModel):
         entity: BaseEntity,
         fill_multiple: bool = False,
         expected_slots: Optional[Set[str]] = None,
+        slot_names: Optional[Iterable[str]] = None,
     ) -> Intent:
         """
         Update :code:`slots[slot_type].values` with a single entity.
@@ -183,33 +183,40 @@ class Intent(BaseModel):
         :type entity: BaseEntity
         :param fill_multiple:
         :type fill_multiple: bool
+        :param slot_names: Only check these slots, if they are already known to hold the entity's type.
+            All slots are checked by default.
+        :type slot_names: Optional[Iterable[str]]
         :return: The calling Intent with modifications to its slots.
         :rtype: Intent
         """
         logger.debug("Looping through slot_names for each entity.")
-        logger.debug(f"intent slots: {self.slots}")
-        for slot_name, slot in self.slots.items():
+        # Arguments are passed separately so loguru formats them only if the record is emitted.
+        logger.debug("intent slots: {}", self.slots)
+        slots = (
+            self.slots.items()
+            if slot_names is None
+            else ((slot_name, self.slots[slot_name]) for slot_name in slot_names)
+        )
+        for slot_name, slot in slots:
             if expected_slots and slot_name not in expected_slots:
                 continue
-            logger.debug(f"slot_name: {slot_name}")
-            logger.debug(
-                f"slot type: {slot.types}",
-            )
-            logger.debug(
-                f"entity type: {entity.entity_type}",
-            )
+            logger.debug("slot_name: {}", slot_name)
+            logger.debug("slot type: {}", slot.types)
+            logger.debug("entity type: {}", entity.entity_type)
             if entity.entity_type in slot.types:
                 if fill_multiple:
-                    logger.debug(f"filling {entity} into {self.name}.")
+                    logger.debug("filling {} into {}.", entity, self.name)
                     self.slots[slot_name].add(entity)
 
                 elif not self.slots[slot_name].values:
-                    logger.debug(f"filling {entity} into {self.name}.")
+                    logger.debug("filling {} into {}.", entity, self.name)
                     self.slots[slot_name].add(entity)
                 else:
                     logger.debug(
-                        f"removing {entity} from {self.name}, because the slot was filled previously. "
-                        "Use fill_multiple=True if this is not required."
+                        "removing {} from {}, because the slot was filled previously. "
+                        "Use fill_multiple=True if this is not required.",
+                        entity,
+                        self.name,
                     )
                     self.slots[slot_name].clear()
         return self
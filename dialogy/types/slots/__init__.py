@@ -3,7 +3,7 @@ Type definition for Slots. Read :ref:`Intent<Intent>` and :ref:`Slot Filling<Slo
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -42,3 +42,46 @@ class Slot(BaseModel):
 
 
 Rule = Dict[str, Dict[str, Any]]
+SlotTypes = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def compile_rule(rule: Dict[str, Any]) -> SlotTypes:
+    """
+    Validate the slots of a single intent and flatten them to :code:`((slot_name, (entity_type, ...)), ...)`.
+
+    :param rule: A mapping of slot names to an entity type or a list of entity types.
+    :type rule: Dict[str, Any]
+    :raises TypeError: If entity types are neither a str nor a List[str].
+    :return: Slot names paired with the entity types they can hold.
+    :rtype: SlotTypes
+    """
+    slot_types: List[Tuple[str, Tuple[str, ...]]] = []
+    for slot_name, entity_types in rule.items():
+        if isinstance(entity_types, str):
+            slot_types.append((slot_name, (entity_types,)))
+        elif isinstance(entity_types, list) and all(
+            isinstance(type_, str) for type_ in entity_types
+        ):
+            slot_types.append((slot_name, tuple(entity_types)))
+        else:
+            raise TypeError(
+                f"Expected entity_types={entity_types} in the rule"
+                f" {rule} to be a List[str] but {type(entity_types)} was found."
+            )
+    return tuple(slot_types)
+
+
+def compile_rules(rules: Rule) -> Dict[str, SlotTypes]:
+    """
+    Validate and flatten rules for every intent, once.
+
+    Useful for callers that apply the same rules on every request, see :ref:`apply_compiled<ApplySlot>`.
+
+    :param rules: A configuration for slot names and entity types associated with intents.
+    :type rules: Rule
+    :return: Intent names mapped to their flattened slots. Intents without slots are dropped.
+    :rtype: Dict[str, SlotTypes]
+    """
+    return {
+        intent_name: compile_rule(rule) for intent_name, rule in rules.items() if rule
+    }
@@ -188,7 +188,12 @@ class Workflow:
             "Resultant Output intent": [] if not output.intents else output.intents[0],
             "Resultant Output entities": output.entities
         }
-        logger.debug(f"Executed plugin(s) - {plugins_executed_names} \n {pformat(output, sort_dicts=False)}")
+        # This runs after every plugin, the output is only formatted if the debug record is emitted.
+        logger.opt(lazy=True).debug(
+            "Executed plugin(s) - {} \n {}",
+            lambda: plugins_executed_names,
+            lambda: pformat(output, sort_dicts=False),
+        )
 
     async def run(self, input: Input, output: Output = None, **kwargs):  # type: ignore
         """
@@ -56,6 +56,9 @@ class MockResponse:
     async def json(self):
         return json.loads(self._text)
 
+    async def read(self):
+        return self._text.encode("utf-8")
+
     def __getitem__(self, index):
         return json.loads(self._text)[index]
 
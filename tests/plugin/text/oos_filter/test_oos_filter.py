@@ -6,6 +6,22 @@ from tests import EXCEPTIONS, load_tests
 import pytest
 
 
+def test_oos_filter_accepts_int_threshold() -> None:
+    oos_filter = OOSFilterPlugin(
+        dest="output.intents", threshold=1, intent_oos="intent_oos"
+    )
+    assert oos_filter.threshold == 1.0
+    assert isinstance(oos_filter.threshold, float)
+
+    intents = oos_filter.set_oos_intent([Intent(name="already_paid", score=0.8)])
+    assert intents[0].name == "intent_oos"
+
+
+def test_oos_filter_rejects_bool_threshold() -> None:
+    with pytest.raises(TypeError):
+        OOSFilterPlugin(dest="output.intents", threshold=True, intent_oos="intent_oos")
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("payload", load_tests("oos_filter", __file__))
 async def test_oos_filter(payload) -> None:
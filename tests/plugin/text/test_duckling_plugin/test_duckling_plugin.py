@@ -1,9 +1,13 @@
+import asyncio
 import operator
+import pickle
 
+import aiohttp
 import aiohttp.client_exceptions
 import httpretty
 import pandas as pd
 import pytest
+import pytz
 import requests
 import json
 
@@ -71,6 +75,15 @@ def test_duckling_reftime():
         duckling_plugin.validate("test", None)
 
 
+def test_duckling_invalid_timezone():
+    with pytest.raises(pytz.UnknownTimeZoneError):
+        DucklingPlugin(
+            locale="en_IN",
+            dimensions=["time"],
+            timezone="Earth/Someplace",
+        )
+
+
 def test_remove_low_scoring_entities_doesnt_remove_unscored_entities():
     duckling_plugin = DucklingPlugin(
         locale="en_IN", dimensions=["time"], timezone="Asia/Kolkata", threshold=0.2
@@ -125,6 +138,168 @@ async def test_duckling_connection_error() -> None:
         await workflow.run(Input(utterances=[[{"transcript": "test"}]], locale=locale))
 
 
+@pytest.mark.asyncio
+async def test_duckling_retries_unavailable_server(mocker) -> None:
+    mock_entity_json = [
+        {
+            "body": "2 people",
+            "start": 0,
+            "value": {"value": 2, "type": "value", "unit": "person"},
+            "end": 8,
+            "dim": "people",
+            "latent": False,
+        }
+    ]
+    post = mocker.patch(
+        "aiohttp.ClientSession.post",
+        side_effect=[
+            MockResponse("Service Unavailable", 503),
+            MockResponse(json.dumps(mock_entity_json), 200),
+        ],
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["people"],
+        timezone="Asia/Kolkata",
+        backoff_factor=0,
+    )
+
+    entities = await duckling_plugin.parse(["2 people"])
+    assert post.call_count == 2
+    assert [entity.entity_type for entity in entities] == ["people"]
+
+
+@pytest.mark.asyncio
+async def test_duckling_retries_connect_timeout(mocker) -> None:
+    post = mocker.patch(
+        "aiohttp.ClientSession.post",
+        side_effect=[aiohttp.ConnectionTimeoutError(), MockResponse("[]", 200)],
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+        backoff_factor=0,
+    )
+
+    assert await duckling_plugin.parse(["tomorrow"]) == []
+    assert post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_duckling_retries_server_disconnect(mocker) -> None:
+    post = mocker.patch(
+        "aiohttp.ClientSession.post",
+        side_effect=[aiohttp.ServerDisconnectedError(), MockResponse("[]", 200)],
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+        backoff_factor=0,
+    )
+
+    assert await duckling_plugin.parse(["tomorrow"]) == []
+    assert post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_duckling_timeout_returns_no_entities(mocker) -> None:
+    mocker.patch("aiohttp.ClientSession.post", side_effect=asyncio.TimeoutError)
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+    )
+
+    assert await duckling_plugin.parse(["tomorrow"]) == []
+
+
+@pytest.mark.asyncio
+async def test_duckling_skips_blank_transcripts(mocker) -> None:
+    post = mocker.patch("aiohttp.ClientSession.post")
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+    )
+
+    assert await duckling_plugin.parse(["", "  "]) == []
+    post.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_duckling_queries_repeated_transcripts_once(mocker) -> None:
+    post = mocker.patch(
+        "aiohttp.ClientSession.post", return_value=MockResponse("[]", 200)
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+    )
+
+    entities = await duckling_plugin._get_entities_concurrent(
+        ["tomorrow", "today", "tomorrow"]
+    )
+    assert entities == [[], [], []]
+    assert post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_duckling_caches_responses(mocker) -> None:
+    post = mocker.patch(
+        "aiohttp.ClientSession.post", return_value=MockResponse("[]", 200)
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+        cache_size=1,
+    )
+
+    await duckling_plugin.parse(["tomorrow"], reference_time=1635508800000)
+    await duckling_plugin.parse(["tomorrow"], reference_time=1635508800000)
+    assert post.call_count == 1
+
+    await duckling_plugin.parse(["today"], reference_time=1635508800000)
+    await duckling_plugin.parse(["tomorrow"], reference_time=1635508800000)
+    assert post.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_duckling_closes_session_after_call(mocker) -> None:
+    post = mocker.patch.object(
+        aiohttp.ClientSession,
+        "post",
+        autospec=True,
+        return_value=MockResponse("[]", 200),
+    )
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+    )
+
+    assert await duckling_plugin.parse(["tomorrow"]) == []
+    session = post.call_args[0][0]
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_duckling_plugin_pickles_after_call(mocker) -> None:
+    mocker.patch("aiohttp.ClientSession.post", return_value=MockResponse("[]", 200))
+    duckling_plugin = DucklingPlugin(
+        dest="output.entities",
+        dimensions=["time"],
+        timezone="Asia/Kolkata",
+    )
+
+    await duckling_plugin.parse(["tomorrow"])
+    duckling_plugin_copy = pickle.loads(pickle.dumps(duckling_plugin))
+    assert duckling_plugin_copy.url == duckling_plugin.url
+
+
 @pytest.mark.asyncio
 async def test_max_workers_greater_than_zero() -> None:
     """Checks that "ValueError: max_workers must be greater than 0" is not raised when there are no transcriptions
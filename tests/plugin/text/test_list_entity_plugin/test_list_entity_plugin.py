@@ -9,23 +9,34 @@ from tests import EXCEPTIONS, load_tests
 
 
 class EntMocker:
-    def __init__(self, token, label):
+    def __init__(self, token, label, start_char):
         self.text = token
         self.label_ = label
+        self.start_char = start_char
+        self.end_char = start_char + len(token)
+
+
+class DocMocker:
+    def __init__(self, ents):
+        self.ents = ents
 
 
 class SpacyMocker:
     def __init__(self, payload):
         self.transcripts = [expectation["text"] for expectation in payload]
         self.all_ents = [expectation["entities"] for expectation in payload]
-        self.ents = None
 
     def __call__(self, transcript):
         index = self.transcripts.index(transcript)
-        self.ents = (
-            EntMocker(ent["value"], ent["type"]) for ent in self.all_ents[index]
+        return DocMocker(
+            [
+                EntMocker(ent["value"], ent["type"], transcript.index(ent["value"]))
+                for ent in self.all_ents[index]
+            ]
         )
-        return self
+
+    def pipe(self, transcripts):
+        return (self(transcript) for transcript in transcripts)
 
 
 def mutate(w, v):
@@ -48,6 +59,37 @@ def test_value_error_if_spacy_missing():
         l.ner_search("...")
 
 
+def test_regex_search_finds_every_match():
+    l = ListEntityPlugin(
+        dest="output.entities",
+        style="regex",
+        candidates={"number": {"__value__": [r"\d+", r"one|two"]}},
+    )
+    assert l.regex_search("1 or 2, not one") == [
+        ("1", "number", "1", (0, 1)),
+        ("2", "number", "2", (5, 6)),
+        ("one", "number", "one", (12, 15)),
+    ]
+
+
+def test_regex_patterns_that_cant_be_joined():
+    l = ListEntityPlugin(
+        dest="output.entities",
+        style="regex",
+        candidates={
+            "city": {"delhi": [r"(?i)delhi", r"dilli"]},
+            "number": {"__value__": [r"(?P<n>\d+)", r"(?P<n>one|two)"]},
+        },
+    )
+    assert len(l.compiled_patterns["city"]["delhi"]) == 2
+    assert len(l.compiled_patterns["number"]["__value__"]) == 2
+    assert l.regex_search("DELHI has 1 or two") == [
+        ("DELHI", "city", "delhi", (0, 5)),
+        ("1", "number", "1", (10, 11)),
+        ("two", "number", "two", (15, 18)),
+    ]
+
+
 def test_type_error_if_compiled_patterns_missing():
     with pytest.raises(TypeError):
         l = ListEntityPlugin(
@@ -5,6 +5,7 @@ import pytest
 
 from dialogy.types import BaseEntity
 from dialogy.types.intent import Intent
+from dialogy.types.slots import compile_rules
 
 
 class MockPlugin:
@@ -124,3 +125,22 @@ def test_invalid_rule() -> None:
 
     with pytest.raises(TypeError):
         intent.apply(rules)
+
+
+def test_apply_compiled_rule() -> None:
+    rules = {"intent": {"date_slot": "date", "basic_slot": ["ordinal", "number"]}}
+    compiled_rules = compile_rules(rules)
+    assert compiled_rules == {
+        "intent": (("date_slot", ("date",)), ("basic_slot", ("ordinal", "number")))
+    }
+
+    intent = Intent(name="intent", score=0.8)
+    intent.apply_compiled(compiled_rules["intent"])
+
+    assert intent.slots["date_slot"].types == ["date"]
+    assert intent.slots["basic_slot"].types == ["ordinal", "number"]
+
+
+def test_invalid_compiled_rule() -> None:
+    with pytest.raises(TypeError):
+        compile_rules({"intent": {"basic_slot": [12]}})